@@ -1,5 +1,3 @@
-import pkg_resources
-
 from autoclick.utils import LOG, set_global
 from autoclick.commands import command, group
 from autoclick.core import SignatureError, ParameterCollisionError
@@ -16,7 +14,23 @@ from autoclick.validations import ValidationError, validation
 from autoclick.validations.library import *
 
 
+def _iter_plugin_entry_points():
+    # Prefer importlib.metadata (python 3.8+); importing pkg_resources scans all
+    # installed distributions and dominates the import time of autoclick
+    try:
+        from importlib import metadata
+    except ImportError:
+        import pkg_resources
+        return pkg_resources.iter_entry_points(group="autoclick")
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group="autoclick")
+    else:
+        return entry_points.get("autoclick", ())
+
+
 # Load modules for validation and composite plugins
-for entry_point in pkg_resources.iter_entry_points(group='autoclick'):
+for entry_point in _iter_plugin_entry_points():
     LOG.debug("Loading plugin entry-point %s", str(entry_point))
     entry_point.load()
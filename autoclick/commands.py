@@ -47,7 +47,7 @@ class CommandMixin:
     @staticmethod
     def parse_extra_kwargs(extra_kwargs: Iterable[str]) -> dict:
         def parse_kwarg(kwarg) -> Tuple[str, str]:
-            k, v = kwarg.split("=")
+            k, v = kwarg.split("=", 1)
             k = k.lstrip("-")
             return k, v
         return dict(parse_kwarg(kwarg) for kwarg in extra_kwargs)
@@ -1,11 +1,11 @@
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 import inspect
 import re
 from typing import (
     Any,
     Callable,
-    Collection,
     Dict,
     Generic,
     List,
@@ -24,7 +24,9 @@ import docstring_parser
 
 from autoclick.types import get_conversion
 from autoclick.types.library import OptionalTuple
-from autoclick.utils import EMPTY, EMPTY_OR_NONE, LOG, get_global
+from autoclick.utils import (
+    EMPTY, EMPTY_OR_NONE, LOG, get_global, get_signature, is_collection
+)
 from autoclick.validations import get_validations
 
 
@@ -113,9 +115,9 @@ class ParameterInfo:
         self.match_type = self.anno_type
 
         def resolve_new_type(t):
-            return t.__supertype__ if (
-                inspect.isfunction(t) and hasattr(t, "__supertype__")
-            ) else t
+            # NewType creates a function prior to python 3.10 and an instance of
+            # typing.NewType afterwards; both have a __supertype__ attribute
+            return t.__supertype__ if hasattr(t, "__supertype__") else t
 
         self.anno_type = resolve_new_type(self.anno_type)
 
@@ -167,7 +169,7 @@ class ParameterInfo:
         if (
             self.nargs == 1 and
             self.anno_type != str and
-            issubclass(self.anno_type, Collection)
+            is_collection(self.anno_type)
         ):
             self.multiple = True
 
@@ -196,7 +198,17 @@ class ParsedDocstring:
 
     @classmethod
     def from_function(cls, func: Callable):
-        docs = docstring_parser.parse(func.__doc__)
+        return cls.from_docstring(func.__doc__)
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def from_docstring(cls, docstring: Optional[str]):
+        """
+        Parses a docstring. Results are cached by the docstring text, so decorating
+        functions/classes that share a docstring only parses it once. The returned
+        instances are shared and must not be modified.
+        """
+        docs = docstring_parser.parse(docstring)
 
         if docs.short_description and not docs.long_description:
             desc = docs.short_description
@@ -281,12 +293,12 @@ class BaseDecorator(Generic[DEC], metaclass=ABCMeta):
     def _get_parameter_info(self) -> Dict[str, ParameterInfo]:
         if inspect.isclass(self._decorated):
             signature_parameters = dict(
-                inspect.signature(cast(type, self._decorated).__init__).parameters
+                get_signature(cast(type, self._decorated).__init__).parameters
             )
             signature_parameters.pop("self")
         else:
             signature_parameters = dict(
-                inspect.signature(cast(Callable, self._decorated)).parameters
+                get_signature(cast(Callable, self._decorated)).parameters
             )
 
         parameter_infos = {}
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 import sys
@@ -51,7 +52,20 @@ def version_option(
     return option_class(param_decls or ("--version",), **kwargs)
 
 
+@lru_cache(maxsize=None)
 def get_version(pkg):
+    # Try importlib.metadata (python 3.8+), which is much cheaper to import
+    # than pkg_resources
+    try:
+        from importlib import metadata
+    except ImportError:
+        pass
+    else:
+        try:
+            return metadata.version(pkg)
+        except metadata.PackageNotFoundError:
+            pass
+
     # Try pkg_resources
     try:
         import pkg_resources
@@ -100,6 +114,7 @@ def get_version(pkg):
     raise RuntimeError("Could not determine version")
 
 
+@lru_cache(maxsize=None)
 def get_toml_parser():
     try:
         import tomlkit
@@ -1,13 +1,15 @@
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Collection, Dict, List, Optional, Tuple, Type, Union, cast
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union, cast
 
 import click
 
-from autoclick.utils import get_dest_type
+from autoclick.utils import TypeRegistry, get_dest_type, is_collection
 
 
-CONVERSIONS: Dict[Type, click.ParamType] = {}
+CONVERSIONS: Dict[Type, click.ParamType] = TypeRegistry()
 AUTOCONVERSIONS = []
+AUTOCONVERSIONS_BY_TYPE: Dict[Type, Tuple[Callable, bool]] = {}
+_AUTOCONVERSION_CACHE: Dict[Type, Optional[Tuple[Callable, bool]]] = TypeRegistry()
 DEFAULT_METAVAR = "ARG"
 
 
@@ -148,30 +150,65 @@ def get_conversion(
     if true_type is None:
         true_type = match_type
 
-    for filter_fn, conversion_fn, pass_type in AUTOCONVERSIONS:
-        if filter_fn(true_type):
-            args = []
-            if pass_type:
-                args.append(true_type)
-            if type_args:
-                args.append(type_args)
-            return conversion_fn(*args)
+    match = _find_autoconversion(true_type)
 
-    if issubclass(true_type, Collection):
+    if match is not None:
+        conversion_fn, pass_type = match
+        args = []
+        if pass_type:
+            args.append(true_type)
+        if type_args:
+            args.append(type_args)
+        return conversion_fn(*args)
+
+    if is_collection(true_type):
         return match_type
 
     return true_type
 
 
+def _find_autoconversion(true_type: Type) -> Optional[Tuple[Callable, bool]]:
+    """
+    Finds the autoconversion that applies to a type. Matches are cached until a new
+    autoconversion is registered. Only the matched conversion function is cached,
+    not the ParamType it creates, so that cached types can still be collected.
+    """
+    try:
+        return _AUTOCONVERSION_CACHE[true_type]
+    except KeyError:
+        pass
+
+    match = None
+
+    for base in getattr(true_type, "__mro__", ()):
+        if base in AUTOCONVERSIONS_BY_TYPE:
+            match = AUTOCONVERSIONS_BY_TYPE[base]
+            break
+    else:
+        for filter_fn, conversion_fn, pass_type in AUTOCONVERSIONS:
+            if filter_fn(true_type):
+                match = (conversion_fn, pass_type)
+                break
+
+    _AUTOCONVERSION_CACHE[true_type] = match
+    return match
+
+
 def register_autoconversion(
     filter_fn: Union[Type, Callable[[Type], bool]],
     conversion_fn: Callable[[Type, Optional[List[Type]]], click.ParamType],
     pass_type: bool = True
 ):
-    if isinstance(filter_fn, type):
-        filter_type = cast(type, filter_fn)
-        filter_fn = lambda type_: issubclass(type_, filter_type)
-    AUTOCONVERSIONS.append((filter_fn, conversion_fn, pass_type))
+    if isinstance(filter_fn, type) and not isinstance(filter_fn, ABCMeta):
+        # Concrete types are matched against the MRO of the type being converted.
+        AUTOCONVERSIONS_BY_TYPE[filter_fn] = (conversion_fn, pass_type)
+    else:
+        if isinstance(filter_fn, type):
+            # ABCs may have virtual subclasses, which do not appear in the MRO.
+            filter_type = cast(type, filter_fn)
+            filter_fn = lambda type_: issubclass(type_, filter_type)
+        AUTOCONVERSIONS.append((filter_fn, conversion_fn, pass_type))
+    _AUTOCONVERSION_CACHE.clear()
 
 
 def autoconversion(
@@ -182,6 +219,18 @@ def autoconversion(
     """
     Decorator that registers an automatic conversion for a (usually built-in) type.
 
+    When more than one autoconversion applies to a type, the conversion is chosen
+    as follows:
+
+    * Conversions registered for concrete (non-ABC) types take precedence over
+      those registered with a filter function or an ABC, regardless of the order
+      of registration.
+    * Among concrete types, the one that appears first in the MRO of the type
+      being converted, i.e. the most specific one, is used. Registering a
+      conversion for a concrete type that already has one replaces it.
+    * Filter functions and ABCs are tried in the order they were registered, and
+      the first one that matches is used.
+
     Args:
         filter_fn: Function that returns a boolean indicating whether or not
             the autoconversion applies to a given type.
@@ -22,7 +22,9 @@ from typing import (
 
 import click
 
-from autoclick.types import DEFAULT_METAVAR, AggregateTypeMixin, autoconversion
+from autoclick.types import (
+    DEFAULT_METAVAR, AggregateTypeMixin, autoconversion, register_conversion
+)
 
 
 T = TypeVar("T")
@@ -35,6 +37,14 @@ WritablePath = NewType("WritablePath", pathlib.Path)
 WritableFile = NewType("WritableFile", pathlib.Path)
 WritableDir = NewType("WritableDir", pathlib.Path)
 
+# Register the path types up front so that they are resolved by a single
+# CONVERSIONS lookup rather than by falling through the autoconversions
+_PATH_PARAM_TYPE = click.types.FuncParamType(pathlib.Path)
+for _path_type in (
+    ReadablePath, ReadableFile, ReadableDir, WritablePath, WritableFile, WritableDir
+):
+    register_conversion(_path_type, _PATH_PARAM_TYPE)
+
 
 class BaseType(click.ParamType):
     def __init__(self, metavar: str = None):
@@ -48,19 +58,22 @@ class Directory(BaseType):
     name = "dir"
 
     def __init__(
-        self, *args, create: bool = False, metavar: str = "DIR", **kwargs
+        self, exists: bool = False, *args, create: bool = False,
+        metavar: str = "DIR", **kwargs
     ):
         super().__init__(metavar)
         kwargs.update(
             file_okay=False, dir_okay=True, readable=True, writable=True
         )
-        self._path_type = click.types.Path(*args, **kwargs)
+        # When `create` is set, a missing directory is created rather than being
+        # an error, so `exists` is ignored
+        self._path_type = click.types.Path(exists and not create, *args, **kwargs)
         self._create = create
 
     def convert(self, value, param, ctx) -> pathlib.Path:
         path = pathlib.Path(self._path_type(value, param, ctx))
-        if self._create and not path.exists():
-            path.mkdir(parents=True)
+        if self._create:
+            path.mkdir(parents=True, exist_ok=True)
         return path
 
 
@@ -70,7 +83,7 @@ class OptionalTuple(click.types.Tuple):
         self.types = types
 
     def __call__(self, value, param=None, ctx=None):
-        if value is None or all(v is None for v in value):
+        if value is None or not any(v is not None for v in value):
             return None
         return super().__call__(value, param, ctx)
 
@@ -87,18 +100,73 @@ class DelimitedList(BaseType):
         self.item_type = item_type
         self.delimiter = delimiter
         self.strip_whitespace = strip_whitespace
-        self.choice = click.Choice(list(choices)) if choices else None
+        if choices:
+            if not isinstance(choices, (list, tuple)):
+                choices = list(choices)
+            self._choice = click.Choice(choices)
+            # Valid items are checked against a set; click.Choice is only used for
+            # normalization and error reporting when an item is not an exact match
+            try:
+                self._choice_set = frozenset(choices)
+            except TypeError:
+                # Unhashable choices are only checked by click.Choice
+                self._choice_set = None
+        else:
+            self._choice = None
+            self._choice_set = frozenset()
+
+    @property
+    def choice(self) -> Optional[click.Choice]:
+        """The valid items; read-only, as the set of choices is derived from it."""
+        return self._choice
 
     def convert(self, value, param, ctx) -> Tuple[T]:
         if not value:
             return cast(Tuple[T], ())
+        if self._choice is None:
+            return tuple(self._iter_items(value))
+        choice_set = self._choice_set
+        convert_choice = self._convert_choice
+        if choice_set is not None:
+            try:
+                return tuple(
+                    item if item in choice_set else convert_choice(item, param, ctx)
+                    for item in self._iter_items(value)
+                )
+            except TypeError:
+                # An item is unhashable
+                pass
+        return tuple(
+            convert_choice(item, param, ctx) for item in self._iter_items(value)
+        )
+
+    def _iter_items(self, value: str) -> Iterable[T]:
+        """
+        Splits `value` and strips and converts each item in a single pass.
+        """
         items = value.split(self.delimiter)
+        item_type = self.item_type
         if self.strip_whitespace:
-            items = (item.strip() for item in items)
-        items = tuple(self.item_type(item) for item in items)
-        if self.choice:
-            items = tuple(self.choice.convert(i, param, ctx) for i in items)
-        return items
+            if item_type is str:
+                return (item.strip() for item in items)
+            return (item_type(item.strip()) for item in items)
+        if item_type is str:
+            # The split items are already the result
+            return items
+        return map(item_type, items)
+
+    def _convert_choice(self, item, param, ctx):
+        choices = self._choice.choices
+        try:
+            return self._choice.convert(item, param, ctx)
+        except TypeError:
+            # click.Choice requires hashable string choices; fall back to an
+            # equality check
+            if item in choices:
+                return item
+            self.fail(
+                f"invalid choice: {item}. (choose from {choices})", param, ctx
+            )
 
 
 class RegExp(BaseType, metaclass=ABCMeta):
@@ -109,17 +177,24 @@ class RegExp(BaseType, metaclass=ABCMeta):
     ):
         super().__init__(metavar)
         if isinstance(pattern, str):
-            self.pattern = re.compile(pattern)
+            self._pattern = re.compile(pattern)
         else:
-            self.pattern = cast(Pattern, pattern)
-        self.exact = exact
+            self._pattern = cast(Pattern, pattern)
+        self._exact = exact
+        self._scan = self._pattern.match if exact else self._pattern.search
+
+    @property
+    def pattern(self) -> Pattern:
+        """The compiled pattern; read-only, as the match method is bound to it."""
+        return self._pattern
+
+    @property
+    def exact(self) -> bool:
+        """Whether the whole value must match; read-only, like `pattern`."""
+        return self._exact
 
     def convert(self, value, param, ctx):
-        if self.exact:
-            match = self.pattern.match(value)
-        else:
-            match = self.pattern.search(value)
-        return self._handle_match(match, value, param, ctx)
+        return self._handle_match(self._scan(value), value, param, ctx)
 
     @abstractmethod
     def _handle_match(self, match: Match, value, param, ctx):
@@ -167,19 +242,43 @@ class EnumChoice(Generic[E], BaseType):
         self, enum_class: Sequence[E], xform="upper", metavar: Optional[str] = None
     ):
         super().__init__(metavar)
-        self.choice = click.Choice(list(e.name for e in list(enum_class)))
-        self.metavar = metavar or self.choice.get_metavar(None)
-        self.enum_class = enum_class
+        self._enum_class = enum_class
+        # Aliases are excluded, as they are when iterating over the enum
+        self._lookup = {
+            name: member
+            for name, member in enum_class.__members__.items()
+            if member.name == name
+        }
+        self._choice = click.Choice(list(self._lookup))
+        self.metavar = metavar or self._choice.get_metavar(None)
         if xform == "upper":
             self.xform = str.upper
         elif xform == "lower":
             self.xform = str.lower
         else:
-            self.xform = lambda s: s
+            self.xform = None
+
+    @property
+    def enum_class(self) -> Sequence[E]:
+        """The enum; read-only, as the member lookup is derived from it."""
+        return self._enum_class
+
+    @property
+    def choice(self) -> click.Choice:
+        """The member names; read-only, like `enum_class`."""
+        return self._choice
 
     def convert(self, value, param, ctx) -> E:
         if isinstance(value, str):
-            return self.enum_class[self.choice.convert(self.xform(value), param, ctx)]
+            xform = self.xform
+            if xform is not None:
+                value = xform(value)
+            member = self._lookup.get(value)
+            if member is not None:
+                return member
+            # Fall back to click.Choice, which also applies token normalization
+            # and produces the error message for invalid values
+            return self._enum_class[self._choice.convert(value, param, ctx)]
         else:
             return cast(E, value)
 
@@ -209,7 +308,9 @@ class Mapping(BaseType, AggregateTypeMixin):
     def convert(self, value, param, ctx) -> Tuple[K, V]:
         # Todo: support conversion of key and value types. Need to expose
         #   core.CONVERSIONS.
-        k, v = value.split("=")
+        k, sep, v = value.partition("=")
+        if not sep:
+            self.fail(f"{value} is not a key=value pair", param, ctx)
         return self.kv_types[0](k), self.kv_types[1](v)
 
     def aggregate(self, values: Iterable[Tuple[K, V]]) -> Dict[K, V]:
@@ -226,29 +327,45 @@ class BaseNumericType(Generic[N], BaseType):
         name: str = None,
         metavar: str = None
     ):
-        self.datatype = datatype
+        self._datatype = datatype
+        self._invalid_message = f'{{}} is not a valid {datatype.__name__}'
         type_name = datatype.__name__.upper()
         self.name = name or self._get_default_name(type_name)
         super().__init__(metavar=metavar or type_name)
 
+    @property
+    def datatype(self) -> Callable[..., Optional[N]]:
+        """The numeric type; read-only, as the error messages are derived from it."""
+        return self._datatype
+
     def _get_default_name(self, type_name: str) -> str:
         pass
 
     def convert(self, value, param, ctx) -> Optional[N]:
         try:
-            return self.datatype(value)
+            return self._datatype(value)
         except (ValueError, UnicodeError):
-            self.fail(f'{value} is not a valid {self.datatype}', param, ctx)
+            self.fail(self._invalid_message.format(value), param, ctx)
 
 
 class Positive(Generic[N], BaseNumericType[N]):
+    def __init__(
+        self,
+        datatype: Callable[..., Optional[N]],
+        name: str = None,
+        metavar: str = None
+    ):
+        super().__init__(datatype, name, metavar)
+        self._zero = datatype(0)
+        self._negative_message = f'{datatype.__name__} value must be >= 0'
+
     def _get_default_name(self, type_name: str) -> str:
         return f'POSITIVE_{type_name}'
 
     def convert(self, value, param, ctx) -> Optional[N]:
         value = super().convert(value, param, ctx)
-        if value is not None and value < self.datatype(0):
-            self.fail(f'{self.datatype} value must be >= 0', param, ctx)
+        if value is not None and value < self._zero:
+            self.fail(self._negative_message, param, ctx)
         return value
 
 
@@ -272,15 +389,10 @@ class Range(Generic[N], BaseNumericType[N]):
     def convert(self, value, param, ctx) -> Optional[N]:
         value = super().convert(value, param, ctx)
 
-        failures = []
-
         if self.min_value is not None and value < self.min_value:
-            failures.append(f'must be >= {self.min_value}')
+            self.fail(f'{value} must be >= {self.min_value}', param, ctx)
 
         if self.max_value is not None and value > self.max_value:
-            failures.append(f'must be <= {self.max_value}')
-
-        if failures:
-            self.fail(f'{value}' + ' and '.join(failures))
+            self.fail(f'{value} must be <= {self.max_value}', param, ctx)
 
         return value
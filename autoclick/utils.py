@@ -1,16 +1,60 @@
+from collections.abc import MutableMapping
 import inspect
 import logging
 import sys
-from typing import Callable, Optional, Type, TypeVar
+from typing import Callable, Collection, Optional, Type, TypeVar
+import weakref
 
 
 LOG = logging.getLogger("AutoClick")
 EMPTY = inspect.Signature.empty
 EMPTY_OR_NONE = {EMPTY, None}
 GLOBAL_CONFIG = {}
+# Bound once so that lookups do not have to resolve the `get` attribute each time
+_GLOBAL_CONFIG_GET = GLOBAL_CONFIG.get
+SIGNATURES = weakref.WeakKeyDictionary()
+KNOWN_COLLECTIONS = (list, tuple, set, frozenset, dict, str, bytes, bytearray)
 T = TypeVar("T")
 
 
+class TypeRegistry(MutableMapping):
+    """
+    Mapping keyed by types that only holds weak references to class keys, so that
+    dynamically created classes can be garbage collected once they are no longer
+    used. Other keys (generic aliases, NewTypes, etc.) are held strongly, since
+    typing may discard its own reference to them while they are still registered.
+    """
+    def __init__(self):
+        self._strong = {}
+        self._weak = weakref.WeakKeyDictionary()
+
+    def _mapping_for(self, key):
+        return self._weak if isinstance(key, type) else self._strong
+
+    def __getitem__(self, key):
+        return self._mapping_for(key)[key]
+
+    def __setitem__(self, key, value):
+        self._mapping_for(key)[key] = value
+
+    def __delitem__(self, key):
+        del self._mapping_for(key)[key]
+
+    def __contains__(self, key):
+        return key in self._mapping_for(key)
+
+    def __iter__(self):
+        yield from self._strong
+        yield from self._weak
+
+    def __len__(self):
+        return len(self._strong) + len(self._weak)
+
+    def clear(self):
+        self._strong.clear()
+        self._weak.clear()
+
+
 def set_global(name: str, value: T) -> Optional[T]:
     """
     Configure global AutoClick settings:
@@ -30,33 +74,110 @@ def set_global(name: str, value: T) -> Optional[T]:
     Returns:
         The previous value of the setting.
     """
-    prev = GLOBAL_CONFIG.get(name, None)
+    # Setting names are looked up with string literals, which are interned, so
+    # interning the stored key lets those lookups match by identity
+    if isinstance(name, str):
+        name = sys.intern(name)
+    prev = _GLOBAL_CONFIG_GET(name)
     if prev != value:
         GLOBAL_CONFIG[name] = value
     return prev
 
 
 def get_global(name: str, default: T) -> T:
-    return GLOBAL_CONFIG.get(name, default)
+    return _GLOBAL_CONFIG_GET(name, default)
+
+
+_IS_COLLECTION = TypeRegistry()
+
+
+def is_collection(type_: Type) -> bool:
+    """
+    Returns whether `type_` is a subclass of :class:`typing.Collection`. Built-in
+    collection types are checked first, which avoids going through the ABC
+    subclass hook, and results are cached for as long as the type is alive.
+    """
+    try:
+        return _IS_COLLECTION[type_]
+    except KeyError:
+        pass
+    if isinstance(type_, type) and issubclass(type_, KNOWN_COLLECTIONS):
+        result = True
+    else:
+        result = issubclass(type_, Collection)
+    _IS_COLLECTION[type_] = result
+    return result
+
+
+def get_signature(f: Callable) -> inspect.Signature:
+    """
+    Returns the signature of `f`. Signatures are cached for as long as `f` is alive.
+    """
+    try:
+        return SIGNATURES[f]
+    except KeyError:
+        pass
+    except TypeError:
+        # `f` cannot be weakly referenced
+        return inspect.signature(f)
+    sig = SIGNATURES[f] = inspect.signature(f)
+    return sig
+
+
+_NO_PARAMETERS_MESSAGE = "Function {} must have at least one parameter"
+_MISSING_DEFAULTS_MESSAGE = (
+    "All but the first parameter must have default values in the signature of "
+    "function {}."
+)
+
+
+def _is_plain_function(f: Callable) -> bool:
+    """
+    Returns whether `f` is a function whose signature is fully described by its
+    code object and attributes, i.e. it is not wrapped and does not override its
+    signature.
+    """
+    return (
+        inspect.isfunction(f) and
+        not hasattr(f, "__wrapped__") and
+        not hasattr(f, "__signature__")
+    )
 
 
 def get_match_type(f: Callable) -> Type:
-    params = inspect.signature(f).parameters
+    if (
+        _is_plain_function(f) and
+        not f.__code__.co_kwonlyargcount and
+        not f.__code__.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    ):
+        # Plain functions with only positional-or-keyword parameters can be
+        # inspected via their code object, without building a full signature
+        code = f.__code__
+        num_args = code.co_argcount
+        if num_args == 0:
+            raise ValueError(_NO_PARAMETERS_MESSAGE.format(f))
+        if num_args - len(f.__defaults__ or ()) > 1:
+            raise ValueError(_MISSING_DEFAULTS_MESSAGE.format(f))
+        return f.__annotations__.get(code.co_varnames[0], EMPTY)
+
+    params = get_signature(f).parameters
     if len(params) == 0:
-        raise ValueError(f"Function {f} must have at least one parameter")
+        raise ValueError(_NO_PARAMETERS_MESSAGE.format(f))
     params = list(params.values())
     if len(params) > 1:
         for p in params[1:]:
             if p.default == EMPTY:
-                raise ValueError(
-                    f"All but the first parameter must have default values in "
-                    f"the signature of function {f}."
-                )
+                raise ValueError(_MISSING_DEFAULTS_MESSAGE.format(f))
     return params[0].annotation
 
 
 def get_dest_type(f: Callable) -> Type:
-    dest_type = inspect.signature(f).return_annotation
+    if _is_plain_function(f):
+        # The return annotation of a plain function can be read directly, without
+        # building its full signature
+        dest_type = f.__annotations__.get("return", EMPTY)
+    else:
+        dest_type = get_signature(f).return_annotation
     if dest_type in EMPTY_OR_NONE:
         raise ValueError(f"Function {f} must have a non-None return annotation")
     return dest_type
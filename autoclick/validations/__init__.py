@@ -2,10 +2,10 @@ import re
 from typing import List, Sequence
 
 from autoclick.types import *
-from autoclick.utils import get_match_type
+from autoclick.utils import TypeRegistry, get_match_type
 
 
-VALIDATIONS: Dict[Type, List[Callable]] = {}
+VALIDATIONS: Dict[Type, List[Callable]] = TypeRegistry()
 
 UNDERSCORES = re.compile("_")
 ALPHA_CHARS = set(chr(i) for i in tuple(range(97, 123)) + tuple(range(65, 91)))
@@ -23,9 +23,7 @@ def register_validation(type_: Type, validation_fn: Callable):
         type_:
         validation_fn:
     """
-    if type_ not in VALIDATIONS:
-        VALIDATIONS[type_] = []
-    VALIDATIONS[type_].append(validation_fn)
+    VALIDATIONS.setdefault(type_, []).append(validation_fn)
 
 
 def has_validations(type_: Type) -> bool:
@@ -90,16 +88,16 @@ def validation(
             if len(kwargs) == 2 and set(kwargs.keys()) == {"param_name", "value"}:
                 pass
             elif len(kwargs) != 1:
-                print(kwargs)
                 raise ValueError(
                     "A @validation decorator may only validate a single parameter."
                 )
             else:
-                kwargs = dict(zip(("param_name", "value"), list(kwargs.items())[0]))
+                ((param_name, value),) = kwargs.items()
+                kwargs = {"param_name": param_name, "value": value}
             if kwargs["value"] is not None:
                 target(**kwargs)
 
-        register_validation(match_type, call_target)
+        register_validation(_match_type, call_target)
 
         return call_target
 
@@ -1,8 +1,10 @@
 from enum import Enum
+import errno
 import operator
 import os
 import pathlib
-from typing import Callable, Sequence, Tuple, Union
+import stat
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from autoclick.types.library import (
     ReadablePath,
@@ -28,6 +30,20 @@ class Comparison(Enum):
         self.fn = fn
 
 
+def _is_defined(value) -> bool:
+    """
+    Returns whether a parsed parameter value was specified. Click fills in `False`
+    for flags and an empty tuple for `multiple` options that are not given, so
+    those are treated as undefined, as is `None`. Other falsy values (e.g. 0 or
+    '') were given explicitly and count as defined.
+    """
+    return not (
+        value is None or
+        value is False or
+        (isinstance(value, tuple) and len(value) == 0)
+    )
+
+
 class Defined:
     """
     Validate that some number of paramters are defined.
@@ -36,16 +52,24 @@ class Defined:
         n: Number to compare against the number of defined parameters.
         cmp: Comparison.
     """
+    __slots__ = ("n", "_cmp", "_cmp_fn")
+
     def __init__(self, n: int = 1, cmp: Comparison = Comparison.GE):
         self.n = n
-        self.cmp = cmp
+        self._cmp = cmp
+        self._cmp_fn = cmp.fn
+
+    @property
+    def cmp(self) -> Comparison:
+        """The comparison; read-only, as its function is bound in __init__."""
+        return self._cmp
 
     def __call__(self, **kwargs):
-        defined = len(tuple(filter(None, kwargs.values())))
-        if not self.cmp.fn(defined, self.n):
+        defined = sum(_is_defined(v) for v in kwargs.values())
+        if not self._cmp_fn(defined, self.n):
             raise ValidationError(
                 f"Of the following parameters, the number defined must be " 
-                f"{self.cmp.symbol} {self.n}: {', '.join(kwargs.keys())}"
+                f"{self._cmp.symbol} {self.n}: {', '.join(kwargs.keys())}"
             )
 
 
@@ -54,21 +78,54 @@ def defined_ge(n: int):
 
 
 class Mutex:
+    __slots__ = (
+        "max_defined", "_group_args", "_groups", "_index_groups", "_min_index",
+        "_max_index"
+    )
+
     def __init__(self, *groups: Union[int, Tuple[int, ...]], max_defined: int = 1):
-        self.groups = groups
+        self._group_args = groups
         self.max_defined = max_defined
+        self._groups: Tuple[Tuple[int, ...], ...] = tuple(
+            (group,) if isinstance(group, int) else tuple(group) for group in groups
+        )
+        # Map each parameter index to the group(s) it belongs to
+        self._index_groups: Dict[int, List[int]] = {}
+        for group_idx, group in enumerate(self._groups):
+            for i in group:
+                self._index_groups.setdefault(i, []).append(group_idx)
+        self._min_index = min(self._index_groups, default=0)
+        self._max_index = max(self._index_groups, default=-1)
+
+    @property
+    def groups(self) -> Tuple[Union[int, Tuple[int, ...]], ...]:
+        """The groups as passed in; read-only, as the index map is built from them."""
+        return self._group_args
 
     def __call__(self, **kwargs):
-        args = list(kwargs.items())
-        groups = self.groups or range(len(args))
-        defined = []
-        for group in groups:
-            if isinstance(group, int):
-                group = [group]
-            for i in group:
-                if args[i][1] is not None:
-                    defined.append(group)
-                    break
+        if self._groups:
+            num_params = len(kwargs)
+            if self._max_index >= num_params or self._min_index < -num_params:
+                raise IndexError(
+                    f"Mutex group indices {self._groups} are out of range for "
+                    f"parameters {', '.join(kwargs.keys())}"
+                )
+            index_groups = self._index_groups
+            if self._min_index < 0:
+                # Resolve negative indices against the number of parameters
+                index_groups = {}
+                for i, group_idxs in self._index_groups.items():
+                    index_groups.setdefault(i % num_params, []).extend(group_idxs)
+            defined_idxs = set()
+            for i, value in enumerate(kwargs.values()):
+                if i in index_groups and _is_defined(value):
+                    defined_idxs.update(index_groups[i])
+            defined = [self._groups[group_idx] for group_idx in sorted(defined_idxs)]
+        else:
+            # Each parameter is its own group
+            defined = [
+                (i,) for i, value in enumerate(kwargs.values()) if _is_defined(value)
+            ]
         if len(defined) > self.max_defined:
             group_str = ",".join(f"({','.join(str(i) for i in g)})" for g in defined)
             raise ValidationError(
@@ -85,6 +142,8 @@ class SequenceLength:
         *lengths: either a single value, which specifies the exact length a sequence
             must have, or a min and max value.
     """
+    __slots__ = ("minlen", "maxlen")
+
     def __init__(self, *lengths):
         if len(lengths) == 1:
             self.minlen = self.maxlen = lengths[0]
@@ -104,25 +163,51 @@ class SequenceLength:
             )
 
 
-@validation(ReadablePath)
-def readable_path(param_name: str, value: pathlib.Path):
-    if not value.exists():
+# Errors that mean a path does not exist (the same ones ignored by Path.exists)
+_MISSING_PATH_ERRNOS = {errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP}
+
+
+def _stat(value: pathlib.Path) -> Optional[os.stat_result]:
+    """
+    Returns the result of stat-ing `value`, or None if it does not exist. Each
+    path validation does a single stat and inspects the result, rather than
+    calling `exists()` followed by `is_file()`/`is_dir()`.
+    """
+    try:
+        return os.stat(value)
+    except OSError as err:
+        if err.errno not in _MISSING_PATH_ERRNOS:
+            raise
+    except ValueError:
+        pass
+    return None
+
+
+def _stat_existing(param_name: str, value: pathlib.Path) -> os.stat_result:
+    st = _stat(value)
+    if st is None:
         raise ValidationError(
             f"Parameter {param_name} value {value} does not exist."
         )
+    return st
+
+
+@validation(ReadablePath)
+def readable_path(param_name: str, value: pathlib.Path):
+    _stat_existing(param_name, value)
 
 
-@validation(ReadableFile, depends=(readable_path,))
+@validation(ReadableFile)
 def readable_file(param_name: str, value: pathlib.Path):
-    if not value.is_file():
+    if not stat.S_ISREG(_stat_existing(param_name, value).st_mode):
         raise ValidationError(
             f"Parameter {param_name} value {value} is not a file."
         )
 
 
-@validation(ReadableDir, depends=(readable_path,))
+@validation(ReadableDir)
 def readable_dir(param_name: str, value: pathlib.Path):
-    if not value.is_dir():
+    if not stat.S_ISDIR(_stat_existing(param_name, value).st_mode):
         raise ValidationError(
             f"Parameter {param_name} value {value} is not a directory."
         )
@@ -130,12 +215,14 @@ def readable_dir(param_name: str, value: pathlib.Path):
 
 @validation(WritablePath)
 def writable_path(param_name: str, value: pathlib.Path):
-    existing = value
-    while not existing.exists():
-        if existing.parent:
-            existing = existing.parent
-        else:
+    # Find the closest existing ancestor, working on strings to avoid creating
+    # a Path object for each level
+    existing = os.fspath(value)
+    while not os.path.exists(existing):
+        parent = os.path.dirname(existing) or os.curdir
+        if parent == existing:
             break
+        existing = parent
     if not os.access(existing, os.W_OK):
         raise ValidationError(
             f"Parameter {param_name} value {value} is not writable."
@@ -144,7 +231,8 @@ def writable_path(param_name: str, value: pathlib.Path):
 
 @validation(WritableFile, depends=(writable_path,))
 def writable_file(param_name: str, value: pathlib.Path):
-    if value.exists() and not value.is_file():
+    st = _stat(value)
+    if st is not None and not stat.S_ISREG(st.st_mode):
         raise ValidationError(
             f"Parameter {param_name} value {value} exists and is not a file."
         )
@@ -152,7 +240,8 @@ def writable_file(param_name: str, value: pathlib.Path):
 
 @validation(WritableDir, depends=(writable_path,))
 def writable_dir(param_name: str, value: pathlib.Path):
-    if value.exists() and not value.is_dir():
+    st = _stat(value)
+    if st is not None and not stat.S_ISDIR(st.st_mode):
         raise ValidationError(
             f"Parameter {param_name} value {value} exists and is not a directory."
         )
@@ -1,12 +1,21 @@
-import sys
+import enum
+import gc
+import inspect
+import pathlib
+import threading
+import weakref
+import click
 import pytest
 
 
-from typing import Dict, Optional
+from typing import Dict, List, NewType, Optional
 import autoclick
+from autoclick.utils import TypeRegistry
+from autoclick.validations import get_validations
 
 
-RESULT = None
+# Holds the values passed to the most recently invoked test command
+STATE = threading.local()
 
 
 @autoclick.composite_type(
@@ -23,14 +32,21 @@ class Foo:
     def __init__(self, num: int, name: str = "foo"):
         self.num = num
         self.name = name
+        self._key = (num, name)
 
     def __eq__(self, other):
-        return self.num == other.num and self.name == other.name
+        return self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
 
     def __repr__(self):
         return "{} {}".format(self.num, self.name)
 
 
+FOO_1 = Foo(1)
+
+
 @autoclick.command()
 def simple(foo: Foo, bar: int = 1, baz: Optional[float] = None):
     """Process some metasyntactic variables.
@@ -40,12 +56,11 @@ def simple(foo: Foo, bar: int = 1, baz: Optional[float] = None):
         bar: A bar
         baz: A baz
     """
-    global RESULT
-    RESULT = dict(
-        foo=foo,
-        bar=bar,
-        baz=baz
-    )
+    STATE.result = {
+        "foo": foo,
+        "bar": bar,
+        "baz": baz
+    }
 
 
 @autoclick.group()
@@ -68,13 +83,12 @@ def simple2(
         baz: A baz
         extra_args:
     """
-    global RESULT
-    RESULT = dict(
-        foo=foo,
-        bar=bar,
-        baz=baz,
-        extra_args=extra_args
-    )
+    STATE.result = {
+        "foo": foo,
+        "bar": bar,
+        "baz": baz,
+        "extra_args": extra_args
+    }
 
 
 class CliTest:
@@ -88,42 +102,336 @@ TEST_CASES = [
     CliTest(
         args=["1"],
         fn=simple,
-        expected=dict(
-            foo=Foo(1),
-            bar=1,
-            baz=None
-        )
+        expected={
+            "foo": FOO_1,
+            "bar": 1,
+            "baz": None
+        }
     ),
     CliTest(
         args=["test", "1"],
         fn=grp,
-        expected=dict(
-            foo=Foo(1),
-            bar=1,
-            baz=None,
-            extra_args={}
-        )
+        expected={
+            "foo": FOO_1,
+            "bar": 1,
+            "baz": None,
+            "extra_args": {}
+        }
     ),
     CliTest(
         args=["test", "1", "-e", "foo=bar"],
         fn=grp,
-        expected=dict(
-            foo=Foo(1),
-            bar=1,
-            baz=None,
-            extra_args={"foo": "bar"}
-        )
+        expected={
+            "foo": FOO_1,
+            "bar": 1,
+            "baz": None,
+            "extra_args": {"foo": "bar"}
+        }
+    ),
+    CliTest(
+        args=["test", "1", "-e", "foo=bar=baz"],
+        fn=grp,
+        expected={
+            "foo": FOO_1,
+            "bar": 1,
+            "baz": None,
+            "extra_args": {"foo": "bar=baz"}
+        }
     )
 ]
 
 
-# TODO: tests cannot be parallelized
 @pytest.mark.parametrize("test_case", TEST_CASES)
 def test_cli(test_case):
-    sys.argv = ["main"] + test_case.args
-    try:
-        test_case.fn()
-    except SystemExit as err:
-        if err.code != 0:
-            raise
-    assert RESULT == test_case.expected
+    test_case.fn.main(test_case.args, prog_name="main", standalone_mode=False)
+    assert STATE.result == test_case.expected
+
+
+Even = NewType("Even", int)
+
+
+@autoclick.validation()
+def even(value: Even, param_name: str = None):
+    if value % 2:
+        raise autoclick.ValidationError(f"{param_name} must be even")
+
+
+def test_validation_inferred_type():
+    assert get_validations(Even) == [even]
+
+
+@autoclick.command(
+    validations={("a", "b", "c", "d"): autoclick.Defined(1)}
+)
+def defined_cmd(
+    a: int = None, b: bool = False, c: List[int] = None, d: str = None
+):
+    STATE.result = {"a": a, "b": b, "c": c, "d": d}
+
+
+@pytest.mark.parametrize("args", [
+    [],         # nothing given; b is False and c is () after parsing
+    ["-b"],
+    ["-c", "1"],
+    ["-a", "0"],
+    ["-d", ""],
+])
+def test_defined(args):
+    if args:
+        defined_cmd.main(args, prog_name="main", standalone_mode=False)
+    else:
+        with pytest.raises(autoclick.ValidationError):
+            defined_cmd.main(args, prog_name="main", standalone_mode=False)
+
+
+def test_type_registry_weak_class_keys():
+    registry = TypeRegistry()
+    new_type = NewType("Local", int)
+    new_type_ref = weakref.ref(new_type)
+    registry[new_type] = "newtype"
+    dynamic_class = type("Dynamic", (), {})
+    class_ref = weakref.ref(dynamic_class)
+    registry[dynamic_class] = "class"
+    del new_type, dynamic_class
+    gc.collect()
+    # Non-class keys are held strongly; classes are dropped once unreferenced
+    assert new_type_ref() is not None
+    assert registry[new_type_ref()] == "newtype"
+    assert class_ref() is None
+    assert len(registry) == 1
+
+
+def test_conversion_cache_does_not_keep_types_alive():
+    from autoclick.types import get_conversion
+    from autoclick.utils import is_collection
+    dynamic_enum = enum.Enum("E", "A B")
+    assert get_conversion(dynamic_enum) is not None
+    assert not is_collection(dynamic_enum)
+    ref = weakref.ref(dynamic_enum)
+    del dynamic_enum
+    gc.collect()
+    assert ref() is None
+
+
+def test_delimited_list_attributes_are_live():
+    dlist = autoclick.DelimitedList()
+    dlist.delimiter = ";"
+    assert dlist.convert("a;b,c", None, None) == ("a", "b,c")
+    dlist.strip_whitespace = False
+    assert dlist.convert("a; b", None, None) == ("a", " b")
+    dlist.item_type = int
+    assert dlist.convert("1;2", None, None) == (1, 2)
+
+
+def test_enum_choice_attributes_are_live():
+    color = enum.Enum("Color", "red green")
+    choice = autoclick.EnumChoice(color, xform=None)
+    assert choice.convert("red", None, None) is color.red
+    choice.xform = str.lower
+    assert choice.convert("GREEN", None, None) is color.green
+
+
+@pytest.mark.parametrize("kwargs,value,expected", [
+    (dict(strip_whitespace=False), "a, b ,c", ("a", " b ", "c")),
+    (dict(), "a, b ,c", ("a", "b", "c")),
+    (dict(item_type=int), "1, 2,3", (1, 2, 3)),
+    (dict(choices=["a", "b"]), "a, b", ("a", "b")),
+    (dict(choices=["a", "b"]), "a,c", click.BadParameter),
+    (dict(), "", ()),
+    (dict(item_type=int, choices=[1, 2]), "", ()),
+])
+def test_delimited_list(kwargs, value, expected):
+    dlist = autoclick.DelimitedList(**kwargs)
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            dlist.convert(value, None, None)
+    else:
+        assert dlist.convert(value, None, None) == expected
+
+
+@pytest.mark.parametrize("choices,value,expected", [
+    ([["a"]], "a", (["a"],)),
+    ([["a"]], "b", click.BadParameter),
+    (["a"], "a", click.BadParameter),
+])
+def test_delimited_list_unhashable(choices, value, expected):
+    dlist = autoclick.DelimitedList(item_type=lambda s: [s], choices=choices)
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            dlist.convert(value, None, None)
+    else:
+        assert dlist.convert(value, None, None) == expected
+
+
+@autoclick.command()
+def paths_cmd(infile: autoclick.ReadableFile, outdir: autoclick.WritableDir):
+    STATE.result = {"infile": infile, "outdir": outdir}
+
+
+def test_new_type_conversion_and_validation(tmp_path):
+    infile = tmp_path / "in.txt"
+    infile.write_text("x")
+    paths_cmd.main(
+        [str(infile), str(tmp_path)], prog_name="main", standalone_mode=False
+    )
+    assert STATE.result == {"infile": infile, "outdir": tmp_path}
+    assert isinstance(STATE.result["infile"], pathlib.Path)
+    with pytest.raises(autoclick.ValidationError):
+        paths_cmd.main(
+            [str(tmp_path / "missing.txt"), str(tmp_path)],
+            prog_name="main", standalone_mode=False
+        )
+    with pytest.raises(autoclick.ValidationError):
+        paths_cmd.main(
+            [str(infile), str(infile)], prog_name="main", standalone_mode=False
+        )
+
+
+@pytest.mark.parametrize("validation_fn,kind,valid", [
+    (autoclick.readable_path, "missing", False),
+    (autoclick.readable_path, "file", True),
+    (autoclick.readable_file, "missing", False),
+    (autoclick.readable_file, "file", True),
+    (autoclick.readable_file, "dir", False),
+    (autoclick.readable_dir, "missing", False),
+    (autoclick.readable_dir, "dir", True),
+    (autoclick.readable_dir, "file", False),
+    (autoclick.writable_file, "missing", True),
+    (autoclick.writable_file, "file", True),
+    (autoclick.writable_file, "dir", False),
+    (autoclick.writable_dir, "missing", True),
+    (autoclick.writable_dir, "dir", True),
+    (autoclick.writable_dir, "file", False),
+])
+def test_path_validations(tmp_path, validation_fn, kind, valid):
+    path = tmp_path / kind
+    if kind == "file":
+        path.write_text("x")
+    elif kind == "dir":
+        path.mkdir()
+    if valid:
+        validation_fn(p=path)
+    else:
+        with pytest.raises(autoclick.ValidationError):
+            validation_fn(p=path)
+
+
+def test_directory_create(tmp_path):
+    directory = autoclick.Directory(create=True)
+    nested = tmp_path / "a" / "b"
+    assert directory.convert(str(nested), None, None) == nested
+    assert nested.is_dir()
+    assert directory.convert(str(nested), None, None) == nested
+    for directory in (
+        autoclick.Directory(True, create=True),
+        autoclick.Directory(exists=True, create=True)
+    ):
+        nested = nested / "c"
+        assert directory.convert(str(nested), None, None) == nested
+        assert nested.is_dir()
+    with pytest.raises(click.BadParameter):
+        autoclick.Directory(True).convert(str(nested / "d"), None, None)
+
+
+def test_positive():
+    positive = autoclick.Positive(int)
+    assert positive.name == "POSITIVE_INT"
+    assert positive.convert("0", None, None) == 0
+    assert autoclick.Positive(int, "P", "NUM").name == "P"
+    with pytest.raises(click.BadParameter, match="^int value must be >= 0$"):
+        positive.convert("-1", None, None)
+
+
+def test_get_match_type_honours_signature_override():
+    from autoclick.utils import get_match_type
+
+    def fn(value: int, other: str):
+        pass
+
+    with pytest.raises(ValueError):
+        get_match_type(fn)
+    fn.__signature__ = inspect.Signature([
+        inspect.Parameter(
+            "value", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str
+        )
+    ])
+    assert get_match_type(fn) is str
+
+
+@autoclick.command()
+def mapping_cmd(kv: Dict[str, str] = None):
+    STATE.result = kv
+
+
+def test_mapping_option():
+    mapping_cmd.main(["-k", "a=b=c"], prog_name="main", standalone_mode=False)
+    assert STATE.result == {"a": "b=c"}
+    with pytest.raises(click.BadParameter):
+        mapping_cmd.main(["-k", "a"], prog_name="main", standalone_mode=False)
+
+
+@pytest.mark.parametrize("mutex,kwargs,expected", [
+    (autoclick.Mutex(), dict(a=False, b=False), None),
+    (autoclick.Mutex(), dict(a=(), b=None, c=True), None),
+    (autoclick.Mutex(), dict(a=True, b=0), autoclick.ValidationError),
+    (autoclick.Mutex(0, (1, 2)), dict(a=False, b=(), c=1), None),
+    (autoclick.Mutex(0, (1, 2)), dict(a=True, b=(), c=1), autoclick.ValidationError),
+    (autoclick.Mutex(0, -1), dict(a=1, b=None, c=2), autoclick.ValidationError),
+    (autoclick.Mutex(5), dict(a=1), IndexError),
+    (autoclick.Mutex(0, -3), dict(a=1, b=2), IndexError),
+])
+def test_mutex(mutex, kwargs, expected):
+    if expected is None:
+        mutex(**kwargs)
+    else:
+        with pytest.raises(expected):
+            mutex(**kwargs)
+
+
+@pytest.mark.parametrize("obj,attr", [
+    (autoclick.DelimitedList(choices=["a"]), "choice"),
+    (autoclick.EnumChoice(enum.Enum("Color", "red green")), "enum_class"),
+    (autoclick.EnumChoice(enum.Enum("Color", "red green")), "choice"),
+    (autoclick.Matches("a"), "pattern"),
+    (autoclick.Matches("a"), "exact"),
+    (autoclick.Positive(int), "datatype"),
+    (autoclick.Defined(1), "cmp"),
+    (autoclick.Mutex(0, 1), "groups"),
+])
+def test_derived_attributes_are_read_only(obj, attr):
+    getattr(obj, attr)
+    with pytest.raises(AttributeError):
+        setattr(obj, attr, None)
+
+
+def test_set_global_non_str_key():
+    from autoclick.utils import get_global
+    assert autoclick.set_global(1, 2) is None
+    assert get_global(1, None) == 2
+    assert autoclick.set_global(1, None) == 2
+
+
+def test_autoconversion_precedence():
+    from autoclick.types import get_conversion, register_autoconversion
+
+    class Base:
+        pass
+
+    class Sub(Base):
+        pass
+
+    class Other:
+        pass
+
+    register_autoconversion(
+        lambda type_: type_ in (Sub, Other), lambda: "filter", pass_type=False
+    )
+    register_autoconversion(Sub, lambda: "sub", pass_type=False)
+    register_autoconversion(Base, lambda: "base", pass_type=False)
+    # Concrete types beat earlier filters, and the most specific type wins
+    assert get_conversion(Sub) == "sub"
+    assert get_conversion(Base) == "base"
+    assert get_conversion(Other) == "filter"
+    # Registering the same concrete type again replaces its conversion
+    register_autoconversion(Sub, lambda: "sub2", pass_type=False)
+    assert get_conversion(Sub) == "sub2"